@@ -1,6 +1,5 @@
 import asyncio
 import inspect
-import json
 import logging
 import types
 import typing as T
@@ -24,6 +23,12 @@ from .models import (
     parse_component,
 )
 
+try:
+    # faster decoding of the status update stream if available
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 UpdateCallbackSync = T.Callable[["pupil_labs.realtime_api.models.Component"], None]
@@ -57,7 +62,7 @@ class Device(DeviceBase):
             if response.status != 200:
                 raise DeviceError(response.status, confirmation["message"])
             result = confirmation["result"]
-            logger.debug(f"[{self}.get_status] Received status: {result}")
+            logger.debug("[%s.get_status] Received status: %s", self, result)
             return Status.from_dict(result)
 
     async def status_updates(self) -> T.AsyncIterator[Component]:
@@ -67,11 +72,11 @@ class Device(DeviceBase):
         async for websocket in websockets.connect(websocket_status_endpoint):
             try:
                 async for message_raw in websocket:
-                    message_json = json.loads(message_raw)
+                    message_json = json_loads(message_raw)
                     try:
                         component = parse_component(message_json)
                     except UnknownComponentError:
-                        logger.warning(f"Dropping unknown component: {component}")
+                        logger.warning("Dropping unknown component: %s", message_json)
                         continue
                     yield component
             except websockets.ConnectionClosed:
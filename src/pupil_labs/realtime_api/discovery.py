@@ -1,6 +1,6 @@
 import asyncio
 import logging
-import time
+import sys
 import types
 import typing as T
 
@@ -11,34 +11,96 @@ from .models import DiscoveredDeviceInfo
 
 logger = logging.getLogger(__name__)
 
+_MAX_CONCURRENT_INFO_REQUESTS = 8
+_SERVICE_NAME_PREFIX = "PI monitor:"
+
+# AsyncZeroconf instances are bound to the event loop they were created in. Networks
+# running concurrently in the same loop share one instance (and its sockets and
+# cache); it is closed once the last of them is closed.
+_shared_zeroconf: T.Dict[asyncio.AbstractEventLoop, AsyncZeroconf] = {}
+_shared_zeroconf_refs: T.Dict[asyncio.AbstractEventLoop, int] = {}
+# keeps closing tasks scheduled from synchronous code alive until they are done
+_closing_tasks: T.Set[asyncio.Task] = set()
+
+
+def _acquire_shared_zeroconf() -> AsyncZeroconf:
+    loop = asyncio.get_running_loop()
+    if loop not in _shared_zeroconf:
+        _shared_zeroconf[loop] = AsyncZeroconf()
+        _shared_zeroconf_refs[loop] = 0
+    _shared_zeroconf_refs[loop] += 1
+    return _shared_zeroconf[loop]
+
+
+def _unref_shared_zeroconf() -> T.Optional[AsyncZeroconf]:
+    """Drop a reference, returning the instance if it is to be closed by the caller"""
+    loop = asyncio.get_running_loop()
+    _shared_zeroconf_refs[loop] -= 1
+    if _shared_zeroconf_refs[loop] > 0:
+        return None
+    del _shared_zeroconf_refs[loop]
+    return _shared_zeroconf.pop(loop)
+
+
+async def _release_shared_zeroconf() -> None:
+    aiozeroconf = _unref_shared_zeroconf()
+    if aiozeroconf is not None:
+        await aiozeroconf.async_close()
+
 
 class Network:
     def __init__(self) -> None:
         self._devices = {}
+        self._devices_snapshot: T.Optional[T.Tuple[DiscoveredDeviceInfo, ...]] = ()
         self._new_devices = asyncio.Queue()
-        self._aiozeroconf = AsyncZeroconf()
-        self._aiobrowser = AsyncServiceBrowser(
-            self._aiozeroconf.zeroconf,
-            "_http._tcp.local.",
-            handlers=[self._handle_service_change],
-        )
+        pending_services: asyncio.Queue = asyncio.Queue()
+        self._pending_services: T.Optional[asyncio.Queue] = pending_services
+        self._aiozeroconf = _acquire_shared_zeroconf()
+        try:
+            self._aiobrowser = AsyncServiceBrowser(
+                self._aiozeroconf.zeroconf,
+                "_http._tcp.local.",
+                handlers=[self._handle_service_change],
+            )
+        except BaseException:
+            aiozeroconf = _unref_shared_zeroconf()
+            if aiozeroconf is not None:
+                # closing is asynchronous and cannot be awaited here
+                closing = asyncio.create_task(aiozeroconf.async_close())
+                _closing_tasks.add(closing)
+                closing.add_done_callback(_closing_tasks.discard)
+            raise
+        # a fixed number of workers bounds the concurrent service info requests
+        self._info_workers: T.List[asyncio.Task] = [
+            asyncio.create_task(self._request_info_worker(pending_services))
+            for _ in range(_MAX_CONCURRENT_INFO_REQUESTS)
+        ]
         self._open = True
 
     async def close(self) -> None:
         if self._open:
+            for worker in self._info_workers:
+                worker.cancel()
+            # wait for the workers to be cancelled
+            await asyncio.gather(*self._info_workers, return_exceptions=True)
+            self._info_workers.clear()
             await self._aiobrowser.async_cancel()
-            await self._aiozeroconf.async_close()
+            await _release_shared_zeroconf()
             self._devices.clear()
             self._devices = None
-            while not self._new_devices.empty():
-                self._new_devices.get_nowait()
+            self._devices_snapshot = ()
+            # no consumers remain after closing, drop the queued items
+            self._new_devices = asyncio.Queue()
+            self._pending_services = None
             self._aiobrowser = None
             self._aiozeroconf = None
             self._open = False
 
     @property
     def devices(self) -> T.Tuple[DiscoveredDeviceInfo, ...]:
-        return tuple(self._devices.values())
+        if self._devices_snapshot is None:
+            self._devices_snapshot = tuple(self._devices.values())
+        return self._devices_snapshot
 
     async def wait_for_new_device(
         self, timeout_seconds: T.Optional[float] = None
@@ -51,31 +113,44 @@ class Network:
     def _handle_service_change(
         self, zeroconf, service_type: str, name: str, state_change: ServiceStateChange
     ) -> None:
+        if not is_valid_service_name(name):
+            return  # most _http._tcp services on the network are not Companion apps
         logger.debug(f"{state_change} {name}")
-        if is_valid_service_name(name) and state_change in (
-            ServiceStateChange.Added,
-            ServiceStateChange.Updated,
-        ):
-            asyncio.create_task(
-                self._request_info_and_put_new_device(
-                    zeroconf, service_type, name, timeout_ms=3000
-                )
-            )
+        if state_change in (ServiceStateChange.Added, ServiceStateChange.Updated):
+            if self._pending_services is not None:  # None once closed
+                self._pending_services.put_nowait((zeroconf, service_type, name))
         elif name in self._devices:
             del self._devices[name]
+            self._devices_snapshot = None
+
+    async def _request_info_worker(self, pending_services: asyncio.Queue) -> None:
+        while True:
+            zeroconf, service_type, name = await pending_services.get()
+            try:
+                await self._request_info_and_put_new_device(
+                    zeroconf, service_type, name, timeout_ms=3000
+                )
+            except Exception:
+                logger.exception("Failed to request service info for %s", name)
 
     async def _request_info_and_put_new_device(
         self, zeroconf, service_type, name, timeout_ms
     ):
         info = AsyncServiceInfo(service_type, name)
         if await info.async_request(zeroconf, timeout_ms):
+            # names recur with every service update, intern them to share one copy
+            name = sys.intern(name)
             device = DiscoveredDeviceInfo(
                 name,
-                info.server,
+                sys.intern(info.server),
                 info.port,
-                [".".join([str(symbol) for symbol in addr]) for addr in info.addresses],
+                tuple(
+                    ".".join([str(symbol) for symbol in addr])
+                    for addr in info.addresses
+                ),
             )
             self._devices[name] = device
+            self._devices_snapshot = None
             await self._new_devices.put(device)
 
     async def __aenter__(self) -> "Network":
@@ -98,19 +173,19 @@ async def discover_devices(
     :param timeout_seconds: Stop after ``timeout_seconds``. If ``None``, run discovery
         forever.
     """
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout_seconds is None else loop.time() + timeout_seconds
     async with Network() as network:
         while True:
-            if timeout_seconds is not None and timeout_seconds <= 0.0:
+            remaining_seconds = None if deadline is None else deadline - loop.time()
+            if remaining_seconds is not None and remaining_seconds <= 0.0:
                 return
-            t0 = time.perf_counter()
-            device = await network.wait_for_new_device(timeout_seconds)
+            device = await network.wait_for_new_device(remaining_seconds)
             if device is None:
                 return  # timeout reached
             else:
                 yield device
-            if timeout_seconds is not None:
-                timeout_seconds -= time.perf_counter() - t0
 
 
 def is_valid_service_name(name: str) -> bool:
-    return name.split(":")[0] == "PI monitor"
+    return name.startswith(_SERVICE_NAME_PREFIX)
@@ -6,7 +6,7 @@ from dataclasses import asdict
 from dataclasses import dataclass as dataclass_python
 from dataclasses import field
 from datetime import datetime
-from functools import partial
+from functools import cached_property, lru_cache
 from textwrap import indent
 from uuid import UUID
 
@@ -17,6 +17,7 @@ from pydantic import (
     ConfigDict,
     Field,
     StringConstraints,
+    TypeAdapter,
     ValidationError,
     conlist,
     create_model,
@@ -40,7 +41,16 @@ class APIPath(enum.Enum):
     def full_address(
         self, address: str, port: int, protocol: str = "http", prefix: str = "/api"
     ) -> str:
-        return f"{protocol}://{address}:{port}" + prefix + self.value
+        return _full_address(self.value, address, port, protocol, prefix)
+
+
+# A client typically talks to a single device, so the same few addresses are
+# requested over and over again.
+@lru_cache(maxsize=64)
+def _full_address(
+    path: str, address: str, port: int, protocol: str, prefix: str
+) -> str:
+    return f"{protocol}://{address}:{port}{prefix}{path}"
 
 
 class DiscoveredDeviceInfo(T.NamedTuple):
@@ -52,8 +62,16 @@ class DiscoveredDeviceInfo(T.NamedTuple):
     "e.g. ``'pi.local.'``"
     port: int
     "e.g. `8080`"
-    addresses: T.List[str]
-    "e.g. ``['192.168.0.2']``"
+    addresses: T.Tuple[str, ...]
+    "e.g. ``('192.168.0.2',)``"
+
+
+@lru_cache(maxsize=1024)
+def _datetime_from_unix_ns(timestamp_unix_ns: int) -> datetime:
+    # integer arithmetic avoids losing sub-microsecond precision to float rounding.
+    # Event is public, so user-constructed events might carry float timestamps.
+    seconds, nanoseconds = divmod(int(timestamp_unix_ns), 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
 
 
 class Event(T.NamedTuple):
@@ -63,15 +81,11 @@ class Event(T.NamedTuple):
 
     @classmethod
     def from_dict(cls, dct: T.Dict[str, T.Any]) -> "Event":
-        return cls(
-            name=dct.get("name"),
-            recording_id=dct.get("recording_id"),
-            timestamp=dct["timestamp"],
-        )
+        return cls._make((dct.get("name"), dct.get("recording_id"), dct["timestamp"]))
 
     @property
     def datetime(self) -> datetime:
-        return datetime.fromtimestamp(self.timestamp / 1e9)
+        return _datetime_from_unix_ns(self.timestamp)
 
     def __repr__(self) -> str:
         return (
@@ -176,8 +190,22 @@ _model_class_map: T.Dict[str, T.Type[Component]] = {
 TemplateDataFormat = T.Literal["api", "simple"]
 
 
-def _init_cls_with_annotated_fields_only(cls, d: T.Dict[str, T.Any]):
-    return cls(**{attr: d.get(attr, None) for attr in cls.__annotations__})
+def _make_component_builder(
+    cls: T.Type[Component],
+) -> T.Callable[[T.Dict[str, T.Any]], Component]:
+    # NamedTuple._fields holds the annotated fields in declaration order, allowing
+    # to fill the tuple directly without building a kwargs dict per component
+    make, fields = cls._make, cls._fields
+
+    def build(d: T.Dict[str, T.Any]) -> Component:
+        return make(map(d.get, fields))
+
+    return build
+
+
+_component_builders: T.Dict[str, T.Callable[[T.Dict[str, T.Any]], Component]] = {
+    name: _make_component_builder(cls) for name, cls in _model_class_map.items()
+}
 
 
 class UnknownComponentError(ValueError):
@@ -193,21 +221,52 @@ def parse_component(raw: ComponentRaw) -> Component:
         explicitly modelled class or the contained data does not fit the modelled
         fields.
     """
-    model_name = raw["model"]
-    data = raw["data"]
-    try:
-        model_class = _model_class_map[model_name]
-        return _init_cls_with_annotated_fields_only(model_class, data)
-    except KeyError as err:
+    component = _try_parse_component(raw)
+    if component is None:
         raise UnknownComponentError(
-            f"Could not generate component for {model_name} from {data}"
-        ) from err
+            f"Could not generate component for {raw['model']} from {raw['data']}"
+        )
+    return component
+
+
+def _try_parse_component(raw: ComponentRaw) -> T.Optional[Component]:
+    """Like :py:func:`parse_component` but returns ``None`` for unknown components"""
+    build = _component_builders.get(raw["model"])
+    if build is None:
+        return None
+    return build(raw["data"])
+
+
+def _sensor_sort_key(sensor: Sensor) -> T.Tuple[bool, str, str]:
+    # connected sensors first, then ordered by connection type and sensor name
+    return (not sensor.connected, sensor.conn_type, sensor.sensor)
+
+
+# Components are immutable, so the defaults used for missing components are shared
+# instead of being allocated for every status parse or sensor lookup.
+_DEFAULT_HARDWARE = Hardware()
+_DISCONNECTED_DIRECT_SENSORS: T.Dict[Sensor.Name, Sensor] = {
+    name: Sensor(sensor=name.value, conn_type=Sensor.Connection.DIRECT.value)
+    for name in (Sensor.Name.WORLD, Sensor.Name.GAZE, Sensor.Name.IMU, Sensor.Name.EYES)
+}
+
+
+# Status attribute replaced by each component type. Looked up via type() since the
+# component classes are concrete NamedTuples that are never subclassed.
+_status_attribute_by_component_type: T.Dict[T.Type[Component], str] = {
+    Phone: "phone",
+    Hardware: "hardware",
+    Recording: "recording",
+}
 
 
 @dataclass_python
 class Status:
     "Represents the Companion's full status"
 
+    # declared explicitly since dataclass(slots=True) requires Python 3.10
+    __slots__ = ("phone", "hardware", "sensors", "recording", "_sensor_index")
+
     phone: Phone
     hardware: Hardware
     sensors: T.List[Sensor]
@@ -215,89 +274,89 @@ class Status:
 
     @classmethod
     def from_dict(cls, status_json_result: T.List[ComponentRaw]) -> "Status":
-        phone = None  # always present
-        recording = None  # might not be present
-        hardware = Hardware()  # won't be present if glasses are not connected
+        attributes = {
+            "phone": None,  # always present
+            "recording": None,  # might not be present
+            # won't be present if glasses are not connected
+            "hardware": _DEFAULT_HARDWARE,
+        }
         sensors = []
         for dct in status_json_result:
-            try:
-                component = parse_component(dct)
-            except UnknownComponentError:
-                logger.warning(f"Dropping unknown component: {dct}")
+            component = _try_parse_component(dct)
+            if component is None:
+                logger.warning("Dropping unknown component: %s", dct)
                 continue
-            if isinstance(component, Phone):
-                phone = component
-            elif isinstance(component, Hardware):
-                hardware = component
-            elif isinstance(component, Sensor):
+            component_type = type(component)
+            attribute = _status_attribute_by_component_type.get(component_type)
+            if attribute is not None:
+                attributes[attribute] = component
+            elif component_type is Sensor:
                 sensors.append(component)
-            elif isinstance(component, Recording):
-                recording = component
-            elif isinstance(component, NetworkDevice):
+            elif component_type is NetworkDevice:
                 pass  # no need to handle NetworkDevice updates here
             else:
-                logger.warning(f"Unknown model class: {type(component).__name__}")
-        sensors.sort(key=lambda s: (not s.connected, s.conn_type, s.sensor))
-        return cls(phone, hardware, sensors, recording)
+                logger.warning("Unknown model class: %s", component_type.__name__)
+        sensors.sort(key=_sensor_sort_key)
+        return cls(sensors=sensors, **attributes)
+
+    def __post_init__(self) -> None:
+        self._index_sensors()
+
+    def _index_sensors(self) -> None:
+        # Maps (sensor, conn_type) to the position of its first occurrence in
+        # self.sensors, such that sensor updates do not need to scan the list.
+        self._sensor_index: T.Dict[T.Tuple[str, str], int] = {}
+        for idx, sensor in enumerate(self.sensors):
+            self._sensor_index.setdefault((sensor.sensor, sensor.conn_type), idx)
+
+    def _sensor_position(self, sensor_name: str, conn_type: str) -> T.Optional[int]:
+        idx = self._sensor_index.get((sensor_name, conn_type))
+        if idx is not None and idx < len(self.sensors):
+            sensor = self.sensors[idx]
+            if sensor.sensor == sensor_name and sensor.conn_type == conn_type:
+                return idx
+        # self.sensors is public and might have been replaced, filtered or reordered
+        # since it was indexed. Re-index before concluding that there is no match.
+        self._index_sensors()
+        return self._sensor_index.get((sensor_name, conn_type))
 
     def update(self, component: Component) -> None:
-        if isinstance(component, Phone):
-            self.phone = component
-        elif isinstance(component, Hardware):
-            self.hardware = component
-        elif isinstance(component, Recording):
-            self.recording = component
-        elif isinstance(component, Sensor):
-            for idx, sensor in enumerate(self.sensors):
-                if (
-                    sensor.sensor == component.sensor
-                    and sensor.conn_type == component.conn_type
-                ):
-                    self.sensors[idx] = component
-                    break
+        attribute = _status_attribute_by_component_type.get(type(component))
+        if attribute is not None:
+            setattr(self, attribute, component)
+        elif type(component) is Sensor:
+            idx = self._sensor_position(component.sensor, component.conn_type)
+            if idx is not None:
+                self.sensors[idx] = component
 
     def matching_sensors(self, name: Sensor.Name, connection: Sensor.Connection):
+        sensor_name = name.value  # None for Sensor.Name.ANY
+        conn_type = connection.value  # None for Sensor.Connection.ANY
         for sensor in self.sensors:
-            if name is not Sensor.Name.ANY and sensor.sensor != name.value:
+            if sensor_name is not None and sensor.sensor != sensor_name:
                 continue
-            if (
-                connection is not Sensor.Connection.ANY
-                and sensor.conn_type != connection.value
-            ):
+            if conn_type is not None and sensor.conn_type != conn_type:
                 continue
             yield sensor
 
+    def _direct_sensor(self, name: Sensor.Name) -> Sensor:
+        # first DIRECT sensor of that name, looked up through the sensor index
+        idx = self._sensor_position(name.value, Sensor.Connection.DIRECT.value)
+        if idx is None:
+            return _DISCONNECTED_DIRECT_SENSORS[name]
+        return self.sensors[idx]
+
     def direct_world_sensor(self) -> T.Optional[Sensor]:
-        return next(
-            self.matching_sensors(Sensor.Name.WORLD, Sensor.Connection.DIRECT),
-            Sensor(
-                sensor=Sensor.Name.WORLD.value, conn_type=Sensor.Connection.DIRECT.value
-            ),
-        )
+        return self._direct_sensor(Sensor.Name.WORLD)
 
     def direct_gaze_sensor(self) -> T.Optional[Sensor]:
-        return next(
-            self.matching_sensors(Sensor.Name.GAZE, Sensor.Connection.DIRECT),
-            Sensor(
-                sensor=Sensor.Name.GAZE.value, conn_type=Sensor.Connection.DIRECT.value
-            ),
-        )
+        return self._direct_sensor(Sensor.Name.GAZE)
 
     def direct_imu_sensor(self) -> T.Optional[Sensor]:
-        return next(
-            self.matching_sensors(Sensor.Name.IMU, Sensor.Connection.DIRECT),
-            Sensor(
-                sensor=Sensor.Name.IMU.value, conn_type=Sensor.Connection.DIRECT.value
-            ),
-        )
+        return self._direct_sensor(Sensor.Name.IMU)
 
     def direct_eyes_sensor(self) -> T.Optional[Sensor]:
-        return next(
-            self.matching_sensors(Sensor.Name.EYES, Sensor.Connection.DIRECT),
-            Sensor(
-                sensor=Sensor.Name.EYES.value, conn_type=Sensor.Connection.DIRECT.value
-            ),
-        )
+        return self._direct_sensor(Sensor.Name.EYES)
 
 
 TemplateItemWidgetType = Literal[
@@ -306,8 +365,37 @@ TemplateItemWidgetType = Literal[
 TemplateItemInputType = T.Literal["any", "integer", "float"]
 
 
+class _CachesDerivedState:
+    """Base of the template classes, which cache state derived from their fields.
+
+    The cached attributes are dropped whenever a field is assigned and are left out
+    when pickling, since some of them (generated models, closures) are not picklable.
+    """
+
+    # provided by the dataclass decorator of the subclasses
+    __dataclass_fields__: T.ClassVar[T.Dict[str, T.Any]]
+
+    # names of the functools.cached_property attributes holding derived state
+    _cached_attributes: T.Tuple[str, ...] = ()
+
+    def __setattr__(self, name: str, value: T.Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.__dataclass_fields__:
+            self._clear_cached_attributes()
+
+    def __getstate__(self) -> T.Dict[str, T.Any]:
+        state = self.__dict__.copy()
+        for name in self._cached_attributes:
+            state.pop(name, None)
+        return state
+
+    def _clear_cached_attributes(self) -> None:
+        for name in self._cached_attributes:
+            self.__dict__.pop(name, None)
+
+
 @dataclass_pydantic(kw_only=True)
-class TemplateItem:
+class TemplateItem(_CachesDerivedState):
     id: UUID
     title: str
     widget_type: TemplateItemWidgetType
@@ -316,30 +404,43 @@ class TemplateItem:
     help_text: T.Optional[str]
     required: bool
 
+    _cached_attributes = (
+        "_answer_adapters",
+        "_as_dict",
+        "_repr_info",
+        "_api_to_simple_converter",
+    )
+
     def validate_answer(
         self,
         answer: T.Any,
         format: TemplateDataFormat = "simple",
         raise_exception=True,
     ):
-        answers = {str(self.id): self._pydantic_validator(format=format)}
-        model = create_model(
-            f"TemplateItem_{self.id}_Answer",
-            **answers,
-            __config__=ConfigDict(extra="forbid"),
-        )
+        adapter = self._answer_adapters.get(format)
+        if adapter is None:
+            answer_input_type, _ = self._pydantic_validator(format=format)
+            adapter = self._answer_adapters[format] = TypeAdapter(answer_input_type)
         errors = []
         try:
-            model.__pydantic_validator__.validate_assignment(
-                model.model_construct(), str(self.id), answer
-            )
+            adapter.validate_python(answer)
         except ValidationError as e:
-            errors = e.errors()
+            # same error locations as reported by Template.validate_answers
+            item_id = str(self.id)
+            errors = [
+                {**error, "loc": (item_id, *error["loc"])} for error in e.errors()
+            ]
 
         if errors and raise_exception:
+            answers = {str(self.id): self._pydantic_validator(format=format)}
             raise InvalidTemplateAnswersError(self, answers, errors)
         return errors
 
+    @cached_property
+    def _answer_adapters(self) -> T.Dict[str, TypeAdapter]:
+        # building a validator is expensive, so it is built only once per format
+        return {}
+
     def _pydantic_validator(self, format: TemplateDataFormat):
         if self.widget_type in ("SECTION_HEADER", "PAGE_BREAK"):
             return None
@@ -358,6 +459,18 @@ class TemplateItem:
         else:
             raise ValueError(f"unknown format, must be one of: {TemplateDataFormat}")
 
+    @cached_property
+    def _as_dict(self) -> T.Dict[str, T.Any]:
+        # attached to every validation error concerning this item, see
+        # Template.validate_answers
+        return asdict(self)
+
+    @cached_property
+    def _repr_info(self) -> str:
+        # item summary shown next to its answer in the answer model repr
+        infos = (self.title, self.widget_type, self.input_type, self.choices)
+        return " - ".join(map(str, infos))
+
     @property
     def _value_type(self):
         if self.input_type == "integer":
@@ -366,13 +479,45 @@ class TemplateItem:
             return float
         return str
 
+    @cached_property
+    def _api_to_simple_converter(self) -> T.Callable[[T.List[str]], T.Any]:
+        # resolve the conversion for this item's widget and input type only once,
+        # see Template.convert_from_api_to_simple_format
+        if self.widget_type in {"CHECKBOX_LIST", "RADIO_LIST"}:
+            if "" in (self.choices or ()):
+
+                def keep_choices(value):
+                    return value
+
+                return keep_choices
+
+            def convert_choices(value):
+                return [] if value == [""] else value
+
+            return convert_choices
+
+        if self.input_type == "any":
+
+            def convert_text(value):
+                return value[0] if value else ""
+
+            return convert_text
+
+        value_type = self._value_type
+
+        def convert_number(value):
+            value = value[0] if value else ""
+            return None if value == "" else value_type(value)
+
+        return convert_number
+
     def _simple_model_validator(self):
         field = Field(title=self.title, description=self.help_text)
         answer_input_type = self._value_type
         if self.widget_type in {"RADIO_LIST", "CHECKBOX_LIST"}:
             answer_input_type = Annotated[
                 answer_input_type,
-                AfterValidator(partial(option_in_allowed_values, allowed=self.choices)),
+                _choice_validator(tuple(self.choices or ())),
             ]
             if not self.required:
                 field.default_factory = list
@@ -401,7 +546,7 @@ class TemplateItem:
         if self.widget_type in {"RADIO_LIST", "CHECKBOX_LIST"}:
             answer_input_entry_type = Annotated[
                 answer_input_entry_type,
-                AfterValidator(partial(option_in_allowed_values, allowed=self.choices)),
+                _choice_validator(tuple(self.choices or ())),
             ]
         else:
             if self.required:
@@ -427,7 +572,14 @@ class TemplateItem:
 
 
 @dataclass_pydantic(kw_only=True)
-class Template:
+class Template(_CachesDerivedState):
+    """Template definition as configured in the Companion app.
+
+    Answer models and lookups are derived from ``items`` on first use and rebuilt
+    after a new list of items was assigned. Modifying ``items`` in place (e.g.
+    appending to it) is not detected, assign a new list instead.
+    """
+
     created_at: datetime
     id: UUID
     name: str
@@ -441,45 +593,65 @@ class Template:
     published_at: T.Optional[datetime] = None
     archived_at: T.Optional[datetime] = None
 
-    def convert_from_simple_to_api_format(self, data: T.Dict[str, T.Any]):
-        api_format = {}
-        for question_id, value in data.items():
-            if value is None:
-                value = ""
-            if not isinstance(value, list):
-                value = [value]
+    _cached_attributes = (
+        "_answer_models",
+        "_answer_model_base",
+        "_items_by_id",
+        "_api_to_simple_converters",
+    )
 
-            api_format[question_id] = value
-        return api_format
+    def convert_from_simple_to_api_format(self, data: T.Dict[str, T.Any]):
+        return {
+            question_id: (
+                value if isinstance(value, list) else ["" if value is None else value]
+            )
+            for question_id, value in data.items()
+        }
 
     def convert_from_api_to_simple_format(self, data: T.Dict[str, T.List[str]]):
-        simple_format = {}
-        for question_id, value in data.items():
-            question = self.get_question_by_id(question_id)
-            if question.widget_type in {"CHECKBOX_LIST", "RADIO_LIST"}:
-                if value == [""] and "" not in question.choices:
-                    value = []
-            else:
-                if not value:
-                    value = [""]
-
-                value = value[0]
-                if question.input_type != "any":
-                    if value == "":
-                        value = None
-                    else:
-                        value = question._value_type(value)
-
-            simple_format[question_id] = value
-        return simple_format
+        converters = self._api_to_simple_converters
+        return {
+            question_id: converters[str(question_id)](value)
+            for question_id, value in data.items()
+        }
+
+    @cached_property
+    def _api_to_simple_converters(
+        self,
+    ) -> T.Dict[str, T.Callable[[T.List[str]], T.Any]]:
+        return {
+            item_id: item._api_to_simple_converter
+            for item_id, item in self._items_by_id.items()
+        }
 
     def get_question_by_id(self, question_id: T.Union[str, UUID]):
+        return self._items_by_id.get(str(question_id))
+
+    @cached_property
+    def _items_by_id(self) -> T.Dict[str, TemplateItem]:
+        # first occurrence wins, like the linear search this replaces
+        items_by_id: T.Dict[str, TemplateItem] = {}
         for item in self.items:
-            if str(item.id) == str(question_id):
-                return item
-        return None
+            items_by_id.setdefault(str(item.id), item)
+        return items_by_id
+
+    @cached_property
+    def _answer_models(self) -> T.Dict[str, T.Type[BaseModel]]:
+        # building a model is expensive, so each format's model is built only once
+        return {}
 
     def _create_answer_model(self, format: TemplateDataFormat):
+        model = self._answer_models.get(format)
+        if model is None:
+            model = self._answer_models[format] = self._build_answer_model(format)
+        return model
+
+    @cached_property
+    def _answer_model_base(self) -> T.Type[BaseModel]:
+        # shared by the answer models of all formats
+        return make_template_answer_model_base(self)
+
+    def _build_answer_model(self, format: TemplateDataFormat):
         answer_types = {}
         for question in self.items:
             validator = question._pydantic_validator(format=format)
@@ -490,7 +662,7 @@ class Template:
         model = create_model(
             f"Template_{self.id}_Answers",
             **(answer_types),
-            __base__=make_template_answer_model_base(self),
+            __base__=self._answer_model_base,
         )
 
         return model
@@ -501,18 +673,24 @@ class Template:
         raise_exception=True,
         format=TemplateDataFormat,
     ):
+        if not isinstance(answers, T.Mapping):
+            raise TypeError(
+                "answers must be a mapping of question ids to answers, "
+                f"not {type(answers).__name__}"
+            )
         AnswerModel = self._create_answer_model(format=format)
         errors = []
         try:
-            AnswerModel(**answers)
+            AnswerModel.__pydantic_validator__.validate_python(answers)
         except ValidationError as e:
             errors = e.errors()
 
         for error in errors:
-            question_id = error["loc"][0]
-            question = self.get_question_by_id(question_id)
+            if not error["loc"]:
+                continue  # not specific to a question
+            question = self.get_question_by_id(error["loc"][0])
             if question:
-                error["question"] = asdict(question)
+                error["question"] = dict(question._as_dict)
 
         if errors and raise_exception:
             raise InvalidTemplateAnswersError(self, answers, errors)
@@ -537,6 +715,21 @@ def option_in_allowed_values(value, allowed):
     return value
 
 
+@lru_cache(maxsize=256)
+def _choice_validator(choices: T.Tuple[str, ...]) -> AfterValidator:
+    # same check as option_in_allowed_values, with constant time membership tests.
+    # Items offering the same choices share a single validator.
+    allowed = frozenset(choices)
+    choices_repr = repr(list(choices))
+
+    def validate_choice(value):
+        if value not in allowed:
+            raise ValueError(f"{value!r} is not a valid choice from: {choices_repr}")
+        return value
+
+    return AfterValidator(validate_choice)
+
+
 def make_template_answer_model_base(template_: Template):
     class TemplateAnswerModelBase(BaseModel):
         template: T.ClassVar[Template] = template_
@@ -546,24 +739,11 @@ def make_template_answer_model_base(template_: Template):
             return self.__dict__.get(item_id)
 
         def __repr__(self):
-            args = []
-            for item_id, validator in self.model_fields.items():
-                question = self.template.get_question_by_id(item_id)
-                infos = map(
-                    str,
-                    [
-                        question.title,
-                        question.widget_type,
-                        question.input_type,
-                        question.choices,
-                    ],
-                )
-                line = (
-                    f"    {item_id}={self.__dict__[item_id]!r}, "
-                    + f"# {' - '.join(infos)}"
-                )
-                args.append(line)
-            args = "\n".join(args)
+            args = "\n".join(
+                f"    {item_id}={self.__dict__[item_id]!r}, "
+                f"# {self.template.get_question_by_id(item_id)._repr_info}"
+                for item_id in self.model_fields
+            )
 
             return f"Template_{self.template.id}_AnswerModel(\n" + args + "\n)"
 
@@ -587,20 +767,17 @@ class InvalidTemplateAnswersError(Exception):
         try:
             error_lines = []
             for error in self.errors:
-                error_msg = ""
-                error_msg += f'location: {error["loc"]}\n'
-                error_msg += f'  input: {error["input"]}\n'
-                error_msg += f'  message: {error["msg"]}\n'
+                error_parts = [
+                    f'location: {error["loc"]}\n',
+                    f'  input: {error["input"]}\n',
+                    f'  message: {error["msg"]}\n',
+                ]
                 question = error.get("question")
                 if question:
-                    error_msg += (
-                        indent(
-                            f"question: {json.dumps(question, indent=4, default=str)}",
-                            "  ",
-                        )
-                        + "\n"
-                    )
-                error_lines.append(indent(error_msg, "   "))
+                    question_json = json.dumps(question, indent=4, default=str)
+                    error_parts.append(indent(f"question: {question_json}", "  "))
+                    error_parts.append("\n")
+                error_lines.append(indent("".join(error_parts), "   "))
             error_lines = "\n".join(error_lines)
 
             name = "?"
@@ -10,3 +10,20 @@ def test_import_basic() -> None:
     import pupil_labs.realtime_api.simple as simple_module
 
     assert simple_module
+
+
+def test_api_path_full_address() -> None:
+    from pupil_labs.realtime_api.models import APIPath
+
+    assert (
+        APIPath.STATUS.full_address("192.168.1.12", 8080)
+        == "http://192.168.1.12:8080/api/status"
+    )
+    assert (
+        APIPath.STATUS.full_address("192.168.1.12", 8080, protocol="ws")
+        == "ws://192.168.1.12:8080/api/status"
+    )
+    assert (
+        APIPath.EVENT.full_address("pi.local", 8080, prefix="/v2")
+        == "http://pi.local:8080/v2/event"
+    )
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+from zeroconf import ServiceStateChange
+
+from pupil_labs.realtime_api import discovery
+from pupil_labs.realtime_api.discovery import Network, is_valid_service_name
+from pupil_labs.realtime_api.models import DiscoveredDeviceInfo
+
+SERVICE_TYPE = "_http._tcp.local."
+SERVICE_NAME = "PI monitor:Neon Companion:841684._http._tcp.local."
+
+
+class FakeAsyncZeroconf:
+    instances = []
+
+    def __init__(self):
+        self.zeroconf = object()
+        self.closed = False
+        self.instances.append(self)
+
+    async def async_close(self):
+        self.closed = True
+
+
+class FakeAsyncServiceBrowser:
+    def __init__(self, zeroconf, service_type, handlers):
+        self.handlers = handlers
+
+    async def async_cancel(self):
+        pass
+
+
+class FakeAsyncServiceInfo:
+    def __init__(self, service_type, name):
+        self.server = "pi.local."
+        self.port = 8080
+        self.addresses = [b"\xc0\xa8\x01\x0c"]
+
+    async def async_request(self, zeroconf, timeout_ms):
+        return True
+
+
+@pytest.fixture(autouse=True)
+def fake_zeroconf(monkeypatch):
+    FakeAsyncZeroconf.instances = []
+    monkeypatch.setattr(discovery, "AsyncZeroconf", FakeAsyncZeroconf)
+    monkeypatch.setattr(discovery, "AsyncServiceBrowser", FakeAsyncServiceBrowser)
+    monkeypatch.setattr(discovery, "AsyncServiceInfo", FakeAsyncServiceInfo)
+    yield
+    assert not discovery._shared_zeroconf
+    assert not discovery._shared_zeroconf_refs
+
+
+def test_is_valid_service_name():
+    assert is_valid_service_name("PI monitor:Neon Companion:841684._http._tcp.local.")
+    assert is_valid_service_name("PI monitor:OnePlus 8:e2d4._http._tcp.local.")
+    assert not is_valid_service_name("Brother HL-L2350DW._http._tcp.local.")
+    assert not is_valid_service_name("PI monitoring:foo._http._tcp.local.")
+
+
+def test_network_devices_follow_service_changes():
+    async def run():
+        async with Network() as network:
+            aiozeroconf = FakeAsyncZeroconf.instances[0]
+            network._handle_service_change(
+                aiozeroconf, SERVICE_TYPE, SERVICE_NAME, ServiceStateChange.Added
+            )
+            device = await network.wait_for_new_device(timeout_seconds=1.0)
+            assert device == DiscoveredDeviceInfo(
+                SERVICE_NAME, "pi.local.", 8080, ("192.168.1.12",)
+            )
+            assert network.devices == (device,)
+            assert network.devices is network.devices
+
+            network._handle_service_change(
+                aiozeroconf, SERVICE_TYPE, SERVICE_NAME, ServiceStateChange.Removed
+            )
+            assert network.devices == ()
+
+    asyncio.run(run())
+
+
+def test_networks_share_zeroconf():
+    async def run():
+        first, second = Network(), Network()
+        assert first._aiozeroconf is second._aiozeroconf
+        assert len(FakeAsyncZeroconf.instances) == 1
+
+        await first.close()
+        assert not FakeAsyncZeroconf.instances[0].closed
+        await second.close()
+        assert FakeAsyncZeroconf.instances[0].closed
+
+    asyncio.run(run())
+
+
+def test_network_releases_zeroconf_if_browser_fails(monkeypatch):
+    def failing_browser(*args, **kwargs):
+        raise OSError("no multicast")
+
+    monkeypatch.setattr(discovery, "AsyncServiceBrowser", failing_browser)
+
+    async def run():
+        with pytest.raises(OSError):
+            Network()
+        await asyncio.gather(*discovery._closing_tasks)
+        assert FakeAsyncZeroconf.instances[0].closed
+
+    asyncio.run(run())
+
+
+def test_discover_devices_stops_at_deadline():
+    async def run():
+        return [device async for device in discovery.discover_devices(0.05)]
+
+    assert asyncio.run(run()) == []
@@ -0,0 +1,218 @@
+from datetime import datetime
+
+import pytest
+
+from pupil_labs.realtime_api.models import (
+    Event,
+    Hardware,
+    Phone,
+    Sensor,
+    Status,
+    UnknownComponentError,
+    parse_component,
+)
+
+status_list = [
+    {
+        "model": "Phone",
+        "data": {
+            "battery_level": 89,
+            "battery_state": "OK",
+            "device_id": "8cb8ec5bd5bbc0f3",
+            "device_name": "Neon Companion",
+            "ip": "192.168.1.12",
+            "memory": 107198115840,
+            "memory_state": "OK",
+            "time_echo_port": 12321,
+        },
+    },
+    {
+        "model": "Hardware",
+        "data": {
+            "version": "2.0",
+            "glasses_serial": "-1",
+            "world_camera_serial": "-1",
+            "module_serial": "841684",
+        },
+    },
+    {
+        "model": "Sensor",
+        "data": {
+            "sensor": "world",
+            "conn_type": "WEBSOCKET",
+            "connected": True,
+            "ip": "192.168.1.12",
+            "params": "camera=world",
+            "port": 8686,
+            "protocol": "websocket",
+        },
+    },
+    {
+        "model": "Sensor",
+        "data": {
+            "sensor": "gaze",
+            "conn_type": "DIRECT",
+            "connected": False,
+            "ip": None,
+            "params": None,
+            "port": None,
+            "protocol": "rtsp",
+        },
+    },
+    {
+        "model": "Sensor",
+        "data": {
+            "sensor": "world",
+            "conn_type": "DIRECT",
+            "connected": True,
+            "ip": "192.168.1.12",
+            "params": "camera=world",
+            "port": 8086,
+            "protocol": "rtsp",
+        },
+    },
+    {
+        "model": "NetworkDevice",
+        "data": {
+            "ip": "192.168.1.13",
+            "device_id": "4f3a5b7c9d2e1a0b",
+            "device_name": "Other Companion",
+            "connected": True,
+        },
+    },
+]
+
+
+def test_status_from_dict():
+    status = Status.from_dict(status_list)
+
+    assert isinstance(status.phone, Phone)
+    assert status.phone.time_echo_port == 12321
+    assert status.hardware == Hardware("2.0", "-1", "-1", "841684")
+    assert status.recording is None
+    assert [(s.sensor, s.conn_type, s.connected) for s in status.sensors] == [
+        ("world", "DIRECT", True),
+        ("world", "WEBSOCKET", True),
+        ("gaze", "DIRECT", False),
+    ]
+
+
+def test_status_from_dict_without_hardware():
+    status = Status.from_dict([c for c in status_list if c["model"] != "Hardware"])
+    assert status.hardware == Hardware()
+
+
+def test_status_update_sensor():
+    status = Status.from_dict(status_list)
+    gaze = Sensor(
+        sensor="gaze",
+        conn_type="DIRECT",
+        connected=True,
+        ip="192.168.1.12",
+        params="camera=gaze",
+        port=8086,
+    )
+    status.update(gaze)
+
+    assert status.direct_gaze_sensor() == gaze
+    assert gaze.url == "rtsp://192.168.1.12:8086/?camera=gaze"
+    assert len(status.sensors) == 3
+
+
+def test_status_update_ignores_unknown_sensor():
+    status = Status.from_dict(status_list)
+    status.update(Sensor(sensor="imu", conn_type="DIRECT", connected=True))
+
+    assert len(status.sensors) == 3
+    assert not status.direct_imu_sensor().connected
+
+
+def test_status_matching_sensors():
+    status = Status.from_dict(status_list)
+
+    world_sensors = status.matching_sensors(Sensor.Name.WORLD, Sensor.Connection.ANY)
+    assert [s.conn_type for s in world_sensors] == ["DIRECT", "WEBSOCKET"]
+
+    direct_sensors = status.matching_sensors(Sensor.Name.ANY, Sensor.Connection.DIRECT)
+    assert [s.sensor for s in direct_sensors] == ["world", "gaze"]
+
+    assert status.direct_world_sensor().port == 8086
+    assert status.direct_eyes_sensor() == Sensor(sensor="eyes", conn_type="DIRECT")
+
+
+def test_event_from_dict():
+    event = Event.from_dict({"name": "start", "timestamp": 1719218136527503000})
+
+    assert event == ("start", None, 1719218136527503000)
+    assert event.datetime == datetime.fromtimestamp(1719218136.527503)
+    assert event.datetime is event.datetime
+
+    # nanoseconds are truncated to microseconds without float rounding errors
+    event = Event.from_dict({"timestamp": 1719218136999999999})
+    assert event.datetime == datetime.fromtimestamp(1719218136).replace(
+        microsecond=999999
+    )
+
+    # user-constructed events might use float timestamps
+    event = Event("a", None, 1.7e18)
+    assert event.datetime == datetime.fromtimestamp(1.7e9)
+    assert "datetime=" in repr(event)
+
+
+def test_status_from_dict_drops_unknown_components():
+    unknown = {"model": "FutureComponent", "data": {"value": 42}}
+    status = Status.from_dict([unknown, *status_list])
+
+    assert status == Status.from_dict(status_list)
+
+
+def test_parse_component():
+    assert parse_component(status_list[1]) == Hardware("2.0", "-1", "-1", "841684")
+
+    # fields missing from the payload are set to None
+    sensor = parse_component({"model": "Sensor", "data": {"sensor": "imu"}})
+    assert sensor == Sensor("imu", None, None, None, None, None, None)
+
+    with pytest.raises(UnknownComponentError):
+        parse_component({"model": "FutureComponent", "data": {"value": 42}})
+
+
+def test_status_update_after_sensors_were_modified():
+    status = Status.from_dict(status_list)
+    gaze = Sensor("gaze", "DIRECT", True, "192.168.1.12", "camera=gaze", 8086, "rtsp")
+    world = Sensor("world", "DIRECT", False, None, None, None, "rtsp")
+
+    status.sensors = [s for s in status.sensors if s.connected]
+    status.update(gaze)
+    assert gaze not in status.sensors
+
+    status = Status.from_dict(status_list)
+    status.sensors.sort(key=lambda s: s.sensor)
+    status.update(world)
+    assert [(s.sensor, s.conn_type) for s in status.sensors] == [
+        ("gaze", "DIRECT"),
+        ("world", "DIRECT"),
+        ("world", "WEBSOCKET"),
+    ]
+    assert status.sensors[1] == world
+
+
+def test_status_matching_sensors_after_sensors_were_modified():
+    status = Status.from_dict(status_list)
+    status.sensors.sort(key=lambda s: s.sensor)
+    assert status.direct_world_sensor() == Status.from_dict(status_list).sensors[0]
+
+    status.sensors = [s for s in status.sensors if s.conn_type == "WEBSOCKET"]
+    assert not status.direct_world_sensor().connected
+    assert status.direct_world_sensor().conn_type == "DIRECT"
+
+
+def test_status_matching_sensors_yields_duplicates():
+    status = Status.from_dict(status_list)
+    world = status.direct_world_sensor()
+    duplicate = world._replace(port=8087)
+    status.sensors.append(duplicate)
+
+    matches = status.matching_sensors(Sensor.Name.WORLD, Sensor.Connection.DIRECT)
+    assert list(matches) == [world, duplicate]
+    assert status.direct_world_sensor() == world
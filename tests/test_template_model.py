@@ -1,5 +1,7 @@
 # flake8: noqa: E501
+import pickle
 from functools import partial
+from uuid import UUID
 
 import pytest
 
@@ -359,3 +361,119 @@ def test_template_answers_simple_format():
     assert len(errors) == 4
     for error in errors:
         assert "should have at most" in error["msg"]
+
+
+def test_template_answer_models_are_cached():
+    template_def = Template(**template_dict)
+    question = template_def.get_question_by_id("1ebb8823-1e0d-4403-a1bf-c9ac17e312b6")
+
+    for format, answer in (("simple", "short answer"), ("api", ["short answer"])):
+        model = template_def._create_answer_model(format=format)
+        assert template_def._create_answer_model(format=format) is model
+
+        question.validate_answer(answer, format=format)
+        adapter = question._answer_adapters[format]
+        question.validate_answer(answer, format=format)
+        assert question._answer_adapters[format] is adapter
+
+    assert template_def._create_answer_model(
+        format="simple"
+    ) is not template_def._create_answer_model(format="api")
+
+
+def test_template_get_question_by_id():
+    template_def = Template(**template_dict)
+    question_id = "5c3c39d3-6180-45b8-841c-157e5af42507"
+
+    question = template_def.get_question_by_id(question_id)
+    assert question.title == "Required short answer whole number"
+    assert template_def.get_question_by_id(UUID(question_id)) is question
+    assert template_def.get_question_by_id("not-a-question") is None
+
+
+def test_template_convert_api_to_simple_format():
+    template_def = Template(**template_dict)
+
+    # fmt: off
+    api_answers = {
+        "f0c97046-974b-44eb-b00c-50771f9b9200": [""],  # Optional short answer
+        "1ebb8823-1e0d-4403-a1bf-c9ac17e312b6": ["short answer"],  # Required short answer
+        "5c3c39d3-6180-45b8-841c-157e5af42507": ["1234"],  # Required short whole number
+        "7afa73a1-3315-42f7-afec-56f25eb3e33c": [""],  # Optional short whole number
+        "5130bac2-c823-4d3c-bc5d-ab469602b16c": ["23.42"],  # Required short number
+        "c6ceb33a-f883-4a78-9752-6d9744de6f10": [],  # Optional short number
+        "c9b687cd-4bb4-4af6-ae2c-1535b0a4a380": ["Option 1", "Option 2"],  # Required checkbox
+        "2feaac75-93a7-4607-9fac-9bce98a901ee": [""],  # Optional checkbox
+        "22e2f30b-3cfb-44b1-83eb-dddef4ac6d9e": [],  # Optional radio
+    }
+    # fmt: on
+    assert template_def.convert_from_api_to_simple_format(api_answers) == {
+        "f0c97046-974b-44eb-b00c-50771f9b9200": "",
+        "1ebb8823-1e0d-4403-a1bf-c9ac17e312b6": "short answer",
+        "5c3c39d3-6180-45b8-841c-157e5af42507": 1234,
+        "7afa73a1-3315-42f7-afec-56f25eb3e33c": None,
+        "5130bac2-c823-4d3c-bc5d-ab469602b16c": 23.42,
+        "c6ceb33a-f883-4a78-9752-6d9744de6f10": None,
+        "c9b687cd-4bb4-4af6-ae2c-1535b0a4a380": ["Option 1", "Option 2"],
+        "2feaac75-93a7-4607-9fac-9bce98a901ee": [],
+        "22e2f30b-3cfb-44b1-83eb-dddef4ac6d9e": [],
+    }
+
+
+def test_template_convert_simple_to_api_format():
+    template_def = Template(**template_dict)
+
+    # fmt: off
+    simple_answers = {
+        "f0c97046-974b-44eb-b00c-50771f9b9200": None,  # Optional short answer
+        "5c3c39d3-6180-45b8-841c-157e5af42507": 1234,  # Required short whole number
+        "c9b687cd-4bb4-4af6-ae2c-1535b0a4a380": ["Option 1", "Option 2"],  # Required checkbox
+        "22e2f30b-3cfb-44b1-83eb-dddef4ac6d9e": [],  # Optional radio
+    }
+    # fmt: on
+    assert template_def.convert_from_simple_to_api_format(simple_answers) == {
+        "f0c97046-974b-44eb-b00c-50771f9b9200": [""],
+        "5c3c39d3-6180-45b8-841c-157e5af42507": [1234],
+        "c9b687cd-4bb4-4af6-ae2c-1535b0a4a380": ["Option 1", "Option 2"],
+        "22e2f30b-3cfb-44b1-83eb-dddef4ac6d9e": [],
+    }
+
+
+def test_template_pickle_after_validation():
+    template_def = Template(**template_dict)
+    question = template_def.get_question_by_id("1ebb8823-1e0d-4403-a1bf-c9ac17e312b6")
+    question.validate_answer("short answer")
+    template_def.validate_answers({}, format="api", raise_exception=False)
+
+    restored = pickle.loads(pickle.dumps(template_def))
+    assert restored == template_def
+    assert restored.validate_answers({}, format="api", raise_exception=False)
+
+
+def test_template_answer_models_follow_items():
+    template_def = Template(**template_dict)
+    model = template_def._create_answer_model(format="simple")
+
+    template_def.items = template_def.items[:3]
+    new_model = template_def._create_answer_model(format="simple")
+    assert new_model is not model
+    assert list(new_model.model_fields) == ["f0c97046-974b-44eb-b00c-50771f9b9200"]
+
+
+def test_template_lookups_follow_items():
+    template_def = Template(**template_dict)
+    question_id = "5c3c39d3-6180-45b8-841c-157e5af42507"
+    assert template_def.convert_from_api_to_simple_format({question_id: ["1"]})
+
+    template_def.items = [
+        item for item in template_def.items if str(item.id) != question_id
+    ]
+    assert template_def.get_question_by_id(question_id) is None
+    with pytest.raises(KeyError):
+        template_def.convert_from_api_to_simple_format({question_id: ["1"]})
+
+
+def test_template_validate_answers_requires_mapping():
+    template_def = Template(**template_dict)
+    with pytest.raises(TypeError):
+        template_def.validate_answers(["short answer"], format="simple")